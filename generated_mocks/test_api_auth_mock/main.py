@@ -0,0 +1,573 @@
+from fastapi import FastAPI, Request, Depends, HTTPException, status, Form, Body, Query, Path, BackgroundTasks
+from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.templating import Jinja2Templates
+from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.cors import CORSMiddleware
+from typing import List, Dict, Any, Optional
+import json
+import os
+import time
+import sqlite3
+import logging
+from datetime import datetime
+from pathlib import Path
+from logging_middleware import LoggingMiddleware
+from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
+from auth_middleware import verify_api_key, verify_jwt_token, generate_token_response
+from webhook_handler import register_webhook, get_webhooks, delete_webhook, get_webhook_history, trigger_webhooks, test_webhook
+
+# Configure logging for webhook functionality
+logger = logging.getLogger("webhook_handler")
+from storage import StorageManager, get_storage_stats, get_collections
+app = FastAPI(title="test_api", version="1_0_0")
+templates = Jinja2Templates(directory="templates")
+app.add_middleware(LoggingMiddleware)
+app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
+
+# Setup database path for logs (same as in middleware)
+db_dir = Path("db")
+db_dir.mkdir(exist_ok=True)
+DB_PATH = db_dir / "request_logs.db"
+
+# Global variable for active scenario
+active_scenario = None
+
+# Initialize active scenario from database on startup
+def load_active_scenario():
+    global active_scenario
+    try:
+        conn = sqlite3.connect(str(DB_PATH))
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, name, config FROM mock_scenarios WHERE is_active = 1")
+        row = cursor.fetchone()
+        if row:
+            active_scenario = {
+                "id": row[0],
+                "name": row[1],
+                "config": json.loads(row[2]) if row[2] else {}
+            }
+        conn.close()
+    except Exception as e:
+        print(f"Error loading active scenario: {e}")
+        active_scenario = None
+
+# Load active scenario on startup
+load_active_scenario()
+@app.post("/token", summary="Get access token", tags=["authentication"])
+async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
+    return generate_token_response(form_data.username, form_data.password)
+
+# --- Generated Routes ---
+
+@app.get("/users", summary="Get all users")
+async def mock_get_users(background_tasks: BackgroundTasks):
+    """
+    Mock endpoint for GET /users
+    Summary: Get all users
+    """
+    # Check for active scenario override
+    global active_scenario
+    response_data = None
+    
+    if active_scenario and active_scenario.get("config"):
+        # Look for scenario-specific response for this endpoint
+        endpoint_key = "get_users"
+        scenario_config = active_scenario.get("config", {})
+        
+        if endpoint_key in scenario_config:
+            response_data = scenario_config[endpoint_key]
+        elif "/users" in scenario_config:
+            response_data = scenario_config["/users"]
+        elif "responses" in scenario_config and "/users" in scenario_config["responses"]:
+            response_data = scenario_config["responses"]["/users"]
+    
+    # Fall back to default response if no scenario override
+    if response_data is None:
+        
+        # Response based on schema example
+        response_data = [{'$ref_placeholder': '#/components/schemas/User'}, {'$ref_placeholder': '#/components/schemas/User'}]
+        
+    
+    # Trigger webhooks if enabled
+    
+    try:
+        # Determine event type based on HTTP method and path
+        event_type = None
+        if "GET" == "POST":
+            event_type = "data.created"
+        elif "GET" == "PUT" or "GET" == "PATCH":
+            event_type = "data.updated"
+        elif "GET" == "DELETE":
+            event_type = "data.deleted"
+        elif "GET" == "GET":
+            # Only trigger for specific GET endpoints that might be considered data access
+            if "/users" != "/health" and not "/users".startswith("/admin"):
+                event_type = "data.accessed"
+        
+        if event_type:
+            # Create webhook payload
+            webhook_payload = {
+                "method": "GET",
+                "path": "/users",
+                "timestamp": time.time(),
+                "response": response_data
+            }
+            
+            # Add path parameters to payload if they exist
+            
+            
+            # Trigger webhooks in background
+            await trigger_webhooks(event_type, webhook_payload, background_tasks)
+    except Exception as e:
+        # Don't let webhook errors affect the main response
+        logger.error(f"Webhook trigger error: {e}")
+    
+    
+    return response_data
+
+
+@app.post("/users", summary="Create a new user")
+async def mock_post_users(background_tasks: BackgroundTasks):
+    """
+    Mock endpoint for POST /users
+    Summary: Create a new user
+    """
+    # Check for active scenario override
+    global active_scenario
+    response_data = None
+    
+    if active_scenario and active_scenario.get("config"):
+        # Look for scenario-specific response for this endpoint
+        endpoint_key = "post_users"
+        scenario_config = active_scenario.get("config", {})
+        
+        if endpoint_key in scenario_config:
+            response_data = scenario_config[endpoint_key]
+        elif "/users" in scenario_config:
+            response_data = scenario_config["/users"]
+        elif "responses" in scenario_config and "/users" in scenario_config["responses"]:
+            response_data = scenario_config["responses"]["/users"]
+    
+    # Fall back to default response if no scenario override
+    if response_data is None:
+        
+        # Response based on schema example
+        response_data = {'$ref_placeholder': '#/components/schemas/User'}
+        
+    
+    # Trigger webhooks if enabled
+    
+    try:
+        # Determine event type based on HTTP method and path
+        event_type = None
+        if "POST" == "POST":
+            event_type = "data.created"
+        elif "POST" == "PUT" or "POST" == "PATCH":
+            event_type = "data.updated"
+        elif "POST" == "DELETE":
+            event_type = "data.deleted"
+        elif "POST" == "GET":
+            # Only trigger for specific GET endpoints that might be considered data access
+            if "/users" != "/health" and not "/users".startswith("/admin"):
+                event_type = "data.accessed"
+        
+        if event_type:
+            # Create webhook payload
+            webhook_payload = {
+                "method": "POST",
+                "path": "/users",
+                "timestamp": time.time(),
+                "response": response_data
+            }
+            
+            # Add path parameters to payload if they exist
+            
+            
+            # Trigger webhooks in background
+            await trigger_webhooks(event_type, webhook_payload, background_tasks)
+    except Exception as e:
+        # Don't let webhook errors affect the main response
+        logger.error(f"Webhook trigger error: {e}")
+    
+    
+    return response_data
+
+
+@app.get("/users/{id}", summary="Get user by ID")
+async def mock_get_users_id(id: int, background_tasks: BackgroundTasks):
+    """
+    Mock endpoint for GET /users/{id}
+    Summary: Get user by ID
+    """
+    # Check for active scenario override
+    global active_scenario
+    response_data = None
+    
+    if active_scenario and active_scenario.get("config"):
+        # Look for scenario-specific response for this endpoint
+        endpoint_key = "get_users_id"
+        scenario_config = active_scenario.get("config", {})
+        
+        if endpoint_key in scenario_config:
+            response_data = scenario_config[endpoint_key]
+        elif "/users/{id}" in scenario_config:
+            response_data = scenario_config["/users/{id}"]
+        elif "responses" in scenario_config and "/users/{id}" in scenario_config["responses"]:
+            response_data = scenario_config["responses"]["/users/{id}"]
+    
+    # Fall back to default response if no scenario override
+    if response_data is None:
+        
+        # Response based on schema example
+        response_data = {'$ref_placeholder': '#/components/schemas/User'}
+        
+    
+    # Trigger webhooks if enabled
+    
+    try:
+        # Determine event type based on HTTP method and path
+        event_type = None
+        if "GET" == "POST":
+            event_type = "data.created"
+        elif "GET" == "PUT" or "GET" == "PATCH":
+            event_type = "data.updated"
+        elif "GET" == "DELETE":
+            event_type = "data.deleted"
+        elif "GET" == "GET":
+            # Only trigger for specific GET endpoints that might be considered data access
+            if "/users/{id}" != "/health" and not "/users/{id}".startswith("/admin"):
+                event_type = "data.accessed"
+        
+        if event_type:
+            # Create webhook payload
+            webhook_payload = {
+                "method": "GET",
+                "path": "/users/{id}",
+                "timestamp": time.time(),
+                "response": response_data
+            }
+            
+            # Add path parameters to payload if they exist
+            
+            webhook_payload["path_params"] = {
+                
+                
+                "id": id,
+                
+            }
+            
+            
+            # Trigger webhooks in background
+            await trigger_webhooks(event_type, webhook_payload, background_tasks)
+    except Exception as e:
+        # Don't let webhook errors affect the main response
+        logger.error(f"Webhook trigger error: {e}")
+    
+    
+    return response_data
+
+@app.get("/favicon.ico", summary="Favicon", tags=["_system"])
+async def favicon():
+    """Serve favicon to prevent 404 errors in admin UI"""
+    from fastapi.responses import FileResponse
+    import os
+
+    # Try to find favicon.ico in common locations
+    favicon_paths = [
+        "favicon.ico",
+        "../favicon.ico",
+        "../../favicon.ico",
+        os.path.join(os.path.dirname(__file__), "favicon.ico"),
+        os.path.join(os.path.dirname(__file__), "..", "favicon.ico"),
+        os.path.join(os.path.dirname(__file__), "..", "..", "favicon.ico")
+    ]
+
+    for favicon_path in favicon_paths:
+        if os.path.exists(favicon_path):
+            return FileResponse(favicon_path, media_type="image/x-icon")
+
+    # If no favicon found, return a simple 1x1 transparent PNG as fallback
+    from fastapi.responses import Response
+    # 1x1 transparent PNG in base64
+    transparent_png = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\rIDATx\x9cc\xf8\x0f\x00\x00\x01\x00\x01\x00\x18\xdd\x8d\xb4\x00\x00\x00\x00IEND\xaeB`\x82'
+    return Response(content=transparent_png, media_type="image/png")
+# --- End Generated Routes ---
+@app.get("/health", summary="Health check endpoint", tags=["_system"])
+async def health_check(): return {"status": "healthy"}
+if __name__ == "__main__":
+    import uvicorn
+    import threading
+    import time
+
+    def run_business_server():
+        uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # Create admin app at module level
+    admin_app = FastAPI(title="test_api Admin", version="1_0_0")
+    admin_app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
+
+    # Add admin-specific middleware for separate logging
+    from admin_logging_middleware import AdminLoggingMiddleware
+    admin_app.add_middleware(AdminLoggingMiddleware)
+
+    def run_admin_server():
+        # Run the admin server
+        uvicorn.run(admin_app, host="0.0.0.0", port=8001)
+
+    # Admin endpoints
+        # --- Admin API Endpoints ---
+    @admin_app.get("/api/export", tags=["_admin"])
+    async def export_data():
+        import io
+        import zipfile
+        from fastapi.responses import StreamingResponse
+
+        try:
+            # Create in-memory zip file
+            zip_buffer = io.BytesIO()
+
+            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                # Export request logs
+                conn = sqlite3.connect(str(DB_PATH))
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+
+                # Get all request logs
+                cursor.execute('''
+                    SELECT * FROM request_logs ORDER BY created_at DESC
+                ''')
+                logs = cursor.fetchall()
+
+                # Convert to JSON
+                logs_data = []
+                for row in logs:
+                    log_entry = dict(row)
+                    if log_entry.get('headers'):
+                        try:
+                            log_entry['headers'] = json.loads(log_entry['headers'])
+                        except:
+                            pass
+                    logs_data.append(log_entry)
+
+                # Add logs to zip
+                zip_file.writestr("request_logs.json", json.dumps(logs_data, indent=2))
+
+                # Export performance metrics if available
+                try:
+                    cursor.execute('SELECT * FROM performance_metrics ORDER BY recorded_at DESC')
+                    metrics = [dict(row) for row in cursor.fetchall()]
+                    zip_file.writestr("performance_metrics.json", json.dumps(metrics, indent=2))
+                except:
+                    pass
+
+                # Export test sessions if available
+                try:
+                    cursor.execute('SELECT * FROM test_sessions ORDER BY created_at DESC')
+                    sessions = [dict(row) for row in cursor.fetchall()]
+                    zip_file.writestr("test_sessions.json", json.dumps(sessions, indent=2))
+                except:
+                    pass
+
+                conn.close()
+
+                # Add metadata
+                metadata = {
+                    "export_timestamp": time.strftime('%Y-%m-%dT%H:%M:%S%z', time.gmtime()),
+                    "total_logs": len(logs_data),
+                    "database_path": str(DB_PATH),
+                    "server_info": {
+                        "business_port": 8000,
+                        "admin_port": 8001,
+                        "active_scenario": active_scenario
+                    }
+                }
+                zip_file.writestr("metadata.json", json.dumps(metadata, indent=2))
+
+            zip_buffer.seek(0)
+
+            # Return as streaming response
+            def iter_zip():
+                yield zip_buffer.getvalue()
+
+            timestamp = time.strftime('%Y%m%d_%H%M%S', time.gmtime())
+            filename = f"mockloop_export_{timestamp}.zip"
+
+            print(f"DEBUG ADMIN: Exported {len(logs_data)} logs to {filename}")
+
+            return StreamingResponse(
+                iter_zip(),
+                media_type="application/zip",
+                headers={"Content-Disposition": f"attachment; filename={filename}"}
+            )
+
+        except Exception as e:
+            print(f"DEBUG ADMIN: Error exporting data: {e}")
+            return {"error": str(e)}
+
+    @admin_app.get("/api/requests", tags=["_admin"])
+    async def get_request_logs(limit: int = 100, offset: int = 0):
+        try:
+            conn = sqlite3.connect(str(DB_PATH))
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+
+            # Get total count
+            cursor.execute("SELECT COUNT(*) FROM request_logs")
+            total_count = cursor.fetchone()[0]
+
+            # Get paginated logs with all available columns
+            cursor.execute('''
+                SELECT id, timestamp, type, method, path, status_code, process_time_ms,
+                       client_host, client_port, headers, query_params, request_body,
+                       response_body, session_id, test_scenario, correlation_id,
+                       user_agent, response_size, is_admin, created_at
+                FROM request_logs
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+            ''', (limit, offset))
+
+            logs = []
+            for row in cursor.fetchall():
+                log_entry = {
+                    "id": row["id"],
+                    "timestamp": row["timestamp"],
+                    "type": row["type"],
+                    "method": row["method"],
+                    "path": row["path"],
+                    "status_code": row["status_code"],
+                    "process_time_ms": row["process_time_ms"],
+                    "client_host": row["client_host"],
+                    "client_port": row["client_port"],
+                    "headers": json.loads(row["headers"]) if row["headers"] else {},
+                    "query_params": row["query_params"],
+                    "request_body": row["request_body"],
+                    "response_body": row["response_body"],
+                    "session_id": row["session_id"],
+                    "test_scenario": row["test_scenario"],
+                    "correlation_id": row["correlation_id"],
+                    "user_agent": row["user_agent"],
+                    "response_size": row["response_size"],
+                    "is_admin": bool(row["is_admin"]),
+                    "created_at": row["created_at"]
+                }
+                logs.append(log_entry)
+
+            conn.close()
+            print(f"DEBUG ADMIN: Retrieved {len(logs)} logs from database (total: {total_count})")
+            return {"logs": logs, "count": total_count}
+
+        except Exception as e:
+            print(f"DEBUG ADMIN: Error querying database: {e}")
+            return {"logs": [], "count": 0, "error": str(e)}
+
+    @admin_app.get("/api/debug", tags=["_admin"])
+    async def get_debug_info():
+        try:
+            # Get database info
+            conn = sqlite3.connect(str(DB_PATH))
+            cursor = conn.cursor()
+
+            # Check database tables and counts
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            tables = [row[0] for row in cursor.fetchall()]
+
+            table_info = {}
+            for table in tables:
+                cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                count = cursor.fetchone()[0]
+                table_info[table] = count
+
+            # Get recent logs count
+            cursor.execute("SELECT COUNT(*) FROM request_logs WHERE created_at > datetime('now', '-1 hour')")
+            recent_logs = cursor.fetchone()[0]
+
+            # Get schema version
+            cursor.execute("SELECT MAX(version) FROM schema_version")
+            schema_version = cursor.fetchone()[0] or 0
+
+            conn.close()
+
+            debug_info = {
+                "status": "ok",
+                "database": {
+                    "path": str(DB_PATH),
+                    "tables": table_info,
+                    "schema_version": schema_version,
+                    "recent_logs_1h": recent_logs
+                },
+                "server": {
+                    "business_port": 8000,
+                    "admin_port": 8001,
+                    "active_scenario": active_scenario
+                },
+                "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S%z', time.gmtime())
+            }
+
+            print(f"DEBUG ADMIN: Debug info retrieved successfully")
+            return debug_info
+
+        except Exception as e:
+            print(f"DEBUG ADMIN: Error getting debug info: {e}")
+            return {"status": "error", "error": str(e)}
+    @admin_app.get("/api/webhooks", tags=["_admin"])
+    async def admin_get_webhooks():
+        return get_webhooks()
+
+    @admin_app.post("/api/webhooks", tags=["_admin"])
+    async def admin_register_webhook(webhook_data: dict = Body(...)):
+        event_type = webhook_data.get("event_type")
+        url = webhook_data.get("url")
+        description = webhook_data.get("description")
+        if not event_type or not url:
+            raise HTTPException(status_code=400, detail="event_type and url are required")
+        return register_webhook(event_type, url, description)
+
+    @admin_app.delete("/api/webhooks/{webhook_id}", tags=["_admin"])
+    async def admin_delete_webhook(webhook_id: str):
+        return delete_webhook(webhook_id)
+
+    @admin_app.post("/api/webhooks/{webhook_id}/test", tags=["_admin"])
+    async def admin_test_webhook(webhook_id: str):
+        return await test_webhook(webhook_id)
+
+    @admin_app.get("/api/webhooks/history", tags=["_admin"])
+    async def admin_get_webhook_history():
+        return get_webhook_history()
+    @admin_app.get("/api/storage/stats", tags=["_admin"])
+    async def admin_get_storage_stats():
+        return get_storage_stats()
+
+    @admin_app.get("/api/storage/collections", tags=["_admin"])
+    async def admin_get_collections():
+        return get_collections()
+        @admin_app.get("/", response_class=HTMLResponse, summary="Admin UI", tags=["_system"])
+    async def read_admin_ui(request: Request):
+        return templates.TemplateResponse("admin.html", {
+            "request": request,
+            "api_title": "test_api",
+            "api_version": "1_0_0",
+            "auth_enabled": True,
+            "webhooks_enabled": True,
+            "storage_enabled": True
+        })
+
+    # Add health check for admin server
+    @admin_app.get("/health", summary="Admin health check", tags=["_system"])
+    async def admin_health_check():
+        return {"status": "healthy", "server": "admin"}
+
+    # Start both servers
+    if True:
+        # Start admin server in separate thread
+        admin_thread = threading.Thread(target=run_admin_server, daemon=True)
+        admin_thread.start()
+        time.sleep(1)  # Give admin server time to start
+
+        print(f"Mocked API server starting on port 8000")
+        print(f"Admin UI server running on port 8001")
+    else:
+        print(f"Mocked API server starting on port 8000")
+
+    # Start mocked API server (main thread)
+    run_business_server()
\ No newline at end of file
@@ -12,11 +12,24 @@ from typing import Any
 class DatabaseMigrator:
     """Handles database schema migrations for MockLoop servers."""
 
-    def __init__(self, db_path: str):
-        """Initialize the migrator with a database path."""
-        self.db_path = Path(db_path)
+    def __init__(self, db_path: str, uri: bool = False):
+        """
+        Initialize the migrator with a database path.
+
+        Args:
+            db_path: Path to the SQLite database, or an SQLite URI when uri is True
+            uri: Interpret db_path as an SQLite URI (e.g. a shared in-memory
+                database such as "file:name?mode=memory&cache=shared")
+        """
+        # A URI is handed to SQLite as-is; only plain paths are filesystem paths
+        self.db_path: Path | str = db_path if uri else Path(db_path)
+        self.uri = uri
         self.migrations = self._get_migrations()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the managed database."""
+        return sqlite3.connect(str(self.db_path), uri=self.uri)
+
     def _get_migrations(self) -> dict[int, dict[str, Any]]:
         """Define all available migrations."""
         return {
@@ -243,7 +256,7 @@ class DatabaseMigrator:
     def get_current_version(self) -> int:
         """Get the current database schema version."""
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Check if schema_version table exists
@@ -295,7 +308,7 @@ class DatabaseMigrator:
             return True
 
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Apply migrations in order, starting from current version
@@ -385,7 +398,7 @@ class DatabaseMigrator:
             return False
 
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Remove migration records for versions above target
@@ -408,7 +421,7 @@ class DatabaseMigrator:
         latest_available = max(available_migrations) if available_migrations else 0
 
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -439,22 +452,48 @@ class DatabaseMigrator:
         }
 
     def backup_database(self, backup_path: str | None = None) -> str:
-        """Create a backup of the database before migration."""
-        if backup_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = f"{self.db_path.stem}_backup_{timestamp}.db"
+        """
+        Create a backup of the database before migration.
 
-        backup_path = Path(backup_path)
+        Args:
+            backup_path: Where to write the backup. Defaults to
+                "<database stem>_backup_<timestamp>.db" in the current directory,
+                and is required when the database is an SQLite URI.
 
-        try:
-            # Simple file copy for SQLite
-            import shutil
+        Returns:
+            Path of the written backup
 
-            shutil.copy2(self.db_path, backup_path)
-            return str(backup_path)
+        Raises:
+            ValueError: If no backup_path is given for a URI database
+            FileNotFoundError: If the database file does not exist
+        """
+        # Only file databases are stored as a Path; a URI is kept as a string
+        if isinstance(self.db_path, Path):
+            # Connecting would silently create an empty database to back up
+            if not self.db_path.exists():
+                raise FileNotFoundError(f"Database not found: {self.db_path}")
+            if backup_path is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                backup_path = f"{self.db_path.stem}_backup_{timestamp}.db"
+        elif backup_path is None:
+            # A URI has no file name to derive the default backup name from
+            raise ValueError("backup_path is required for a URI database")
 
-        except Exception:
-            raise
+        backup_path = Path(backup_path)
+
+        # SQLite's online backup API takes a consistent snapshot, including any
+        # pages still in the WAL, and also works for in-memory databases
+        source = self._connect()
+        try:
+            target = sqlite3.connect(str(backup_path))
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+        finally:
+            source.close()
+
+        return str(backup_path)
 
 
 def migrate_database(db_path: str, target_version: int | None = None) -> bool:
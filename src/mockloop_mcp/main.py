@@ -19,6 +19,7 @@ if __package__ is None or __package__ == "":
     from generator import APIGenerationError, generate_mock_api
     from log_analyzer import LogAnalyzer
     from mock_server_manager import MockServerManager
+    from utils.event_loop import ensure_uvloop
     from parser import APIParsingError, load_api_specification
     from mcp_audit_logger import create_audit_logger, MCPAuditLogger
     from mcp_compliance import create_compliance_reporter, MCPComplianceReporter
@@ -97,6 +98,7 @@ else:
     from .generator import APIGenerationError, generate_mock_api
     from .log_analyzer import LogAnalyzer
     from .mock_server_manager import MockServerManager
+    from .utils.event_loop import ensure_uvloop
     from .parser import APIParsingError, load_api_specification
     from .mcp_audit_logger import create_audit_logger, MCPAuditLogger
     from .mcp_compliance import create_compliance_reporter, MCPComplianceReporter
@@ -1928,6 +1930,7 @@ def main_cli():
 
         import asyncio
 
+        ensure_uvloop()
         asyncio.run(
             run_tool_from_cli_enhanced(
                 args.spec_source,
@@ -1993,6 +1996,7 @@ def main():
 
         import asyncio
 
+        ensure_uvloop()
         asyncio.run(run_stdio_server())
     elif has_cli_flag or has_positional_args:
         # CLI mode - either explicit --cli flag or positional arguments provided
@@ -151,7 +151,11 @@ class MockServerManager:
         return mock_info
 
     async def discover_running_servers(
-        self, ports: list[int] | None = None, check_health: bool = True
+        self,
+        ports: list[int] | None = None,
+        check_health: bool = True,
+        max_concurrency: int = 64,
+        connect_timeout: float = 1.0,
     ) -> list[dict[str, Any]]:
         """
         Discover running mock servers.
@@ -159,11 +163,15 @@ class MockServerManager:
         Args:
             ports: List of ports to scan
             check_health: Whether to perform health checks
+            max_concurrency: Maximum number of ports probed at the same time
+            connect_timeout: Seconds to wait for each port to accept a connection
 
         Returns:
             List of running server information
         """
-        return await discover_running_servers(ports, check_health)
+        return await discover_running_servers(
+            ports, check_health, max_concurrency, connect_timeout
+        )
 
     async def get_server_status(
         self, server_url: str, admin_port: int | None = None
@@ -0,0 +1,31 @@
+"""
+Event loop setup for the MockLoop MCP entry points.
+"""
+
+import asyncio
+import sys
+
+# uvloop is optional and not available on Windows
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def ensure_uvloop() -> bool:
+    """
+    Install uvloop as the asyncio event loop policy when it is available.
+
+    Must be called before the event loop is created. uvloop does not support
+    Windows, so the default event loop is kept there.
+
+    Returns:
+        True if uvloop was installed, False otherwise
+    """
+    if sys.platform == "win32" or not UVLOOP_AVAILABLE:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
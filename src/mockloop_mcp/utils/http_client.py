@@ -2,8 +2,10 @@
 HTTP client utilities for communicating with mock servers.
 """
 
+from collections.abc import AsyncIterator, Sequence
+import asyncio
+from contextlib import asynccontextmanager
 import logging
-import socket
 from typing import Any
 from urllib.parse import urlparse
 
@@ -12,11 +14,33 @@ import aiohttp
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Common ports scanned when no explicit list is given, including dual-port setups
+_DEFAULT_PORTS: tuple[int, ...] = (
+    8000,
+    8001,
+    8002,
+    8003,
+    8004,
+    8005,
+    8006,
+    8007,
+    3000,
+    3001,
+    5000,
+    5001,
+)
+
 
 class MockServerClient:
     """Client for communicating with MockLoop generated mock servers."""
 
-    def __init__(self, base_url: str, timeout: int = 30, admin_port: int | None = None):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        admin_port: int | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ):
         """
         Initialize the mock server client.
 
@@ -24,10 +48,14 @@ class MockServerClient:
             base_url: Base URL of the mock server (e.g., "http://localhost:8000")
             timeout: Request timeout in seconds
             admin_port: Port for admin API (for dual-port architecture). If None, uses legacy /admin paths
+            session: Shared session whose connection pool is reused across requests.
+                The caller owns it and is responsible for closing it. If None, each
+                request opens its own session.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.admin_port = admin_port
+        self.session = session
 
         # Determine admin base URL
         if admin_port is not None:
@@ -40,6 +68,15 @@ class MockServerClient:
             # Legacy single-port architecture: admin uses /admin paths
             self.admin_base_url = self.base_url
 
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared session, or a short-lived one if none was given."""
+        if self.session is not None:
+            yield self.session
+        else:
+            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+                yield session
+
     async def health_check(self) -> dict[str, Any]:
         """
         Check if the mock server is healthy and responsive.
@@ -48,8 +85,10 @@ class MockServerClient:
             Dict containing health status and server info
         """
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(f"{self.base_url}/health") as response:
+            async with self._session() as session:
+                async with session.get(
+                    f"{self.base_url}/health", timeout=self.timeout
+                ) as response:
                     if response.status == 200:
                         data = await response.json()
                         return {
@@ -109,8 +148,10 @@ class MockServerClient:
                 # Legacy: admin API on same port with /admin/api/* paths
                 admin_url = f"{self.admin_base_url}/admin/api/requests"
 
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(admin_url, params=params) as response:
+            async with self._session() as session:
+                async with session.get(
+                    admin_url, params=params, timeout=self.timeout
+                ) as response:
                     if response.status == 200:
                         logs = await response.json()
                         return {
@@ -150,8 +191,8 @@ class MockServerClient:
                 # Legacy: admin API on same port with /admin/api/* paths
                 admin_url = f"{self.admin_base_url}/admin/api/requests/stats"
 
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(admin_url) as response:
+            async with self._session() as session:
+                async with session.get(admin_url, timeout=self.timeout) as response:
                     if response.status == 200:
                         stats = await response.json()
                         return {"status": "success", "stats": stats}
@@ -180,8 +221,8 @@ class MockServerClient:
                 # Legacy: admin API on same port with /admin/api/* paths
                 admin_url = f"{self.admin_base_url}/admin/api/debug"
 
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(admin_url) as response:
+            async with self._session() as session:
+                async with session.get(admin_url, timeout=self.timeout) as response:
                     if response.status == 200:
                         debug_info = await response.json()
                         return {"status": "success", "debug_info": debug_info}
@@ -223,8 +264,10 @@ class MockServerClient:
                 # Legacy: admin API on same port with /admin/api/* paths
                 admin_url = f"{self.admin_base_url}/admin/api/responses/update"
 
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.post(admin_url, json=payload) as response:
+            async with self._session() as session:
+                async with session.post(
+                    admin_url, json=payload, timeout=self.timeout
+                ) as response:
                     if response.status == 200:
                         result = await response.json()
                         return {
@@ -271,8 +314,10 @@ class MockServerClient:
                 # Legacy: admin API on same port with /admin/api/* paths
                 admin_url = f"{self.admin_base_url}/admin/api/mock-data/scenarios"
 
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.post(admin_url, json=payload) as response:
+            async with self._session() as session:
+                async with session.post(
+                    admin_url, json=payload, timeout=self.timeout
+                ) as response:
                     if response.status == 200:  # Changed from 201 to 200
                         result = await response.json()
                         return {
@@ -332,8 +377,8 @@ class MockServerClient:
                 # Legacy: admin API on same port with /admin/api/* paths
                 admin_url = f"{self.admin_base_url}/admin/api/mock-data/scenarios/{scenario_id}/activate"
 
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.post(admin_url) as response:
+            async with self._session() as session:
+                async with session.post(admin_url, timeout=self.timeout) as response:
                     if response.status == 200:
                         result = await response.json()
                         return {
@@ -368,8 +413,8 @@ class MockServerClient:
                 # Legacy: admin API on same port with /admin/api/* paths
                 admin_url = f"{self.admin_base_url}/admin/api/mock-data/scenarios"
 
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(admin_url) as response:
+            async with self._session() as session:
+                async with session.get(admin_url, timeout=self.timeout) as response:
                     if response.status == 200:
                         scenarios = await response.json()
                         return {
@@ -407,8 +452,8 @@ class MockServerClient:
                     f"{self.admin_base_url}/admin/api/mock-data/scenarios/active"
                 )
 
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(admin_url) as response:
+            async with self._session() as session:
+                async with session.get(admin_url, timeout=self.timeout) as response:
                     if response.status == 200:
                         current_scenario = await response.json()
                         return {
@@ -451,7 +496,10 @@ class MockServerClient:
 
 
 async def discover_running_servers(
-    ports: list[int] | None = None, check_health: bool = True
+    ports: Sequence[int] | None = None,
+    check_health: bool = True,
+    max_concurrency: int = 64,
+    connect_timeout: float = 1.0,
 ) -> list[dict[str, Any]]:
     """
     Discover running MockLoop servers by scanning common ports.
@@ -460,72 +508,86 @@ async def discover_running_servers(
     Args:
         ports: List of ports to scan. If None, scans common ports.
         check_health: Whether to perform health checks on discovered servers
+        max_concurrency: Maximum number of ports probed at the same time
+        connect_timeout: Seconds to wait for each port to accept a connection
 
     Returns:
         List of discovered server information
     """
     if ports is None:
-        # Extended port range to include common dual-port setups
-        ports = [8000, 8001, 8002, 8003, 8004, 8005, 8006, 8007, 3000, 3001, 5000, 5001]
+        ports = _DEFAULT_PORTS
 
-    discovered_servers = []
     potential_admin_ports = set()
-
-    for port in ports:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _probe(
+        port: int, session: aiohttp.ClientSession
+    ) -> dict[str, Any] | None:
+        async with semaphore:
+            try:
+                return await _do_probe(port, session)
+            except Exception as e:
+                logger.debug(f"Port scan failed for port {port}: {e}")
+                # Port scan failed, skip this port
+                return None
+
+    async def _do_probe(
+        port: int, session: aiohttp.ClientSession
+    ) -> dict[str, Any] | None:
+        # Quick port check
         try:
-            # Quick port check
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(("localhost", port))
-            sock.close()
-
-            if result == 0:  # Port is open
-                server_url = f"http://localhost:{port}"
-                server_info = {"url": server_url, "port": port, "status": "discovered"}
-
-                if check_health:
-                    # First try as mocked API server (legacy single-port or dual-port mocked API)
-                    client = MockServerClient(server_url, timeout=5)
-                    health_result = await client.health_check()
-                    server_info.update(health_result)
-
-                    # Try to get additional server info if it's a MockLoop server
-                    if health_result.get("status") == "healthy":
-                        debug_result = await client.get_debug_info()
-                        if debug_result.get("status") == "success":
-                            server_info["is_mockloop_server"] = True
-                            server_info["debug_info"] = debug_result.get(
-                                "debug_info", {}
-                            )
-                            server_info["server_type"] = "business"
-
-                            # Check if this might be part of a dual-port setup
-                            # Look for admin port (typically business_port + 1)
-                            potential_admin_port = port + 1
-                            if potential_admin_port in ports:
-                                potential_admin_ports.add(potential_admin_port)
-                        else:
-                            # Try as admin server (dual-port admin)
-                            admin_client = MockServerClient(
-                                server_url, timeout=5, admin_port=port
-                            )
-                            admin_debug_result = await admin_client.get_debug_info()
-                            if admin_debug_result.get("status") == "success":
-                                server_info["is_mockloop_server"] = True
-                                server_info["debug_info"] = admin_debug_result.get(
-                                    "debug_info", {}
-                                )
-                                server_info["server_type"] = "admin"
-                            else:
-                                server_info["is_mockloop_server"] = False
-                                server_info["server_type"] = "unknown"
-
-                discovered_servers.append(server_info)
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection("localhost", port), timeout=connect_timeout
+            )
+        except (OSError, asyncio.TimeoutError):  # noqa: UP041
+            return None
+        writer.close()
+        await writer.wait_closed()
+
+        server_url = f"http://localhost:{port}"
+        server_info = {"url": server_url, "port": port, "status": "discovered"}
+
+        if check_health:
+            # First try as mocked API server (legacy single-port or dual-port mocked API)
+            client = MockServerClient(server_url, timeout=5, session=session)
+            health_result = await client.health_check()
+            server_info.update(health_result)
+
+            # Try to get additional server info if it's a MockLoop server
+            if health_result.get("status") == "healthy":
+                debug_result = await client.get_debug_info()
+                if debug_result.get("status") == "success":
+                    server_info["is_mockloop_server"] = True
+                    server_info["debug_info"] = debug_result.get("debug_info", {})
+                    server_info["server_type"] = "business"
+
+                    # Check if this might be part of a dual-port setup
+                    # Look for admin port (typically business_port + 1)
+                    potential_admin_port = port + 1
+                    if potential_admin_port in ports:
+                        potential_admin_ports.add(potential_admin_port)
+                else:
+                    # Try as admin server (dual-port admin)
+                    admin_client = MockServerClient(
+                        server_url, timeout=5, admin_port=port, session=session
+                    )
+                    admin_debug_result = await admin_client.get_debug_info()
+                    if admin_debug_result.get("status") == "success":
+                        server_info["is_mockloop_server"] = True
+                        server_info["debug_info"] = admin_debug_result.get(
+                            "debug_info", {}
+                        )
+                        server_info["server_type"] = "admin"
+                    else:
+                        server_info["is_mockloop_server"] = False
+                        server_info["server_type"] = "unknown"
 
-        except Exception as e:
-            logger.debug(f"Port scan failed for port {port}: {e}")
-            # Port scan failed, continue to next port
-            continue
+        return server_info
+
+    # One session for every probe so health and debug calls share a connection pool
+    async with aiohttp.ClientSession() as session:
+        probe_results = await asyncio.gather(*(_probe(port, session) for port in ports))
+    discovered_servers = [info for info in probe_results if info is not None]
 
     # Post-process to identify dual-port setups
     for server in discovered_servers:
@@ -0,0 +1,73 @@
+"""
+Shared MockServerClient probes for the mock data management tests.
+
+Both the unit and the integration suites exercise the same client methods, so
+the call ordering and session handling live here. Each test passes its own
+arguments and runs its own probes.
+"""
+
+import asyncio
+from typing import Any
+
+import aiohttp
+
+from mockloop_mcp.utils.http_client import MockServerClient
+
+
+async def probe_mock_data_methods(
+    server_url: str,
+    update_kwargs: dict[str, Any],
+    scenario_name: str,
+    scenario_config: dict[str, Any],
+    switch_to: str,
+) -> dict[str, Any]:
+    """
+    Call each mock data management method once.
+
+    The scenario create, switch and current-scenario calls run in that order;
+    the response update and scenario listing run concurrently with them.
+
+    Args:
+        server_url: Base URL of the mock server to probe
+        update_kwargs: Keyword arguments for update_response
+        scenario_name: Name of the scenario to create
+        scenario_config: Configuration of the scenario to create
+        switch_to: Name of the scenario to switch to
+
+    Returns:
+        Results keyed by probe name; a failed probe maps to its exception
+    """
+    # One pooled session for all probes instead of a new one per request
+    async with aiohttp.ClientSession() as session:
+        client = MockServerClient(server_url, session=session)
+
+        async def scenario_steps() -> tuple[Any, Any, Any]:
+            # On a live server each step needs the previous one: the switch
+            # needs the created scenario and the current scenario the switch
+            created = await client.create_scenario(
+                scenario_name=scenario_name, scenario_config=scenario_config
+            )
+            switched = await client.switch_scenario(switch_to)
+            current = await client.get_current_scenario()
+            return created, switched, current
+
+        # Only the update and the listing are independent of the scenario
+        # steps, so they run alongside them
+        update_result, list_result, steps = await asyncio.gather(
+            client.update_response(**update_kwargs),
+            client.list_scenarios(),
+            scenario_steps(),
+            return_exceptions=True,
+        )
+
+    if isinstance(steps, BaseException):
+        steps = (steps, steps, steps)
+    create_result, switch_result, current_result = steps
+
+    return {
+        "update": update_result,
+        "create": create_result,
+        "switch": switch_result,
+        "list": list_result,
+        "current": current_result,
+    }
@@ -24,17 +24,56 @@ Examples:
 # ruff: noqa: S311
 
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import json
+import os
 import random
 import sqlite3
 import sys
 import time
 from datetime import datetime, timedelta
+from functools import partial
+from itertools import islice
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Default database path (can be overridden via command line)
 DEFAULT_DB_PATH = Path("db/request_logs.db")
 
+# Generated logs are inserted this many rows at a time
+LOG_INSERT_BATCH_SIZE = 1000
+
+# Generated rows are bound positionally: tuples bind noticeably faster than
+# dicts with named parameters, and rows stay cheap to send back from workers.
+# The tuples built in _generate_log_batch follow these column orders.
+REQUEST_LOG_INSERT_SQL = """
+    INSERT INTO request_logs (
+        id, timestamp, method, path, status_code, process_time_ms,
+        client_ip, client_port, headers, query_params, request_body,
+        response_body, session_id, correlation_id, test_scenario
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+PERFORMANCE_METRIC_INSERT_SQL = """
+    INSERT INTO performance_metrics (
+        request_id, response_time_ms, memory_usage_mb, cpu_usage_percent,
+        db_queries, cache_hits, cache_misses, request_size_bytes,
+        response_size_bytes, timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Analytics indexes as (name, table, column); they are dropped before the bulk
+# load and rebuilt after it
+LOG_INDEXES = [
+    ("idx_request_logs_session_id", "request_logs", "session_id"),
+    ("idx_request_logs_timestamp", "request_logs", "timestamp"),
+    ("idx_performance_metrics_request_id", "performance_metrics", "request_id"),
+]
+
 # Sample endpoints from the Petstore API
 ENDPOINTS = [
     ("/pet/findByStatus", "GET"),
@@ -56,6 +95,31 @@ ENDPOINTS = [
     ("/user/{username}", "DELETE"),
 ]
 
+# Values substituted for each path parameter
+PATH_PARAMETER_VALUES = {
+    "{petId}": [str(n) for n in range(1, 101)],
+    "{orderId}": [str(n) for n in range(1, 1001)],
+    "{username}": [f"user{n}" for n in range(1, 51)],
+}
+
+
+def _expand_path(path):
+    """Return every concrete path for an endpoint template."""
+    for parameter, values in PATH_PARAMETER_VALUES.items():
+        if parameter in path:
+            return [path.replace(parameter, value) for value in values]
+    return [path]
+
+
+# (concrete paths, method) per endpoint, expanded once so rows only pick from
+# them; choosing the endpoint first keeps every endpoint equally likely
+ENDPOINT_PATH_POOLS = [(_expand_path(path), method) for path, method in ENDPOINTS]
+
+# Response status codes with cumulative weights (70/15/8/5/2%), precomputed so
+# random.choices bisects them directly instead of summing weights per call
+STATUS_CODES = [200, 201, 400, 404, 500]
+STATUS_CODE_CUM_WEIGHTS = [70, 85, 93, 98, 100]
+
 # Sample user agents
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -68,6 +132,9 @@ USER_AGENTS = [
     "Apache-HttpClient/4.5.13",
 ]
 
+# Sample request content types
+CONTENT_TYPES = ["application/json", "text/plain"]
+
 # Sample client IPs
 CLIENT_IPS = [
     "192.168.1.100",
@@ -84,9 +151,41 @@ CLIENT_IPS = [
     "203.0.113.3",
 ]
 
-
-def generate_sample_headers(user_agent, client_ip):
+# Sample values for the generated request/response bodies
+PET_NAMES = ["Fluffy", "Buddy", "Max", "Bella", "Charlie", "Luna"]
+PET_STATUSES = ["available", "pending", "sold"]
+PET_CATEGORIES = ["Dogs", "Cats", "Birds"]
+FIRST_NAMES = ["John", "Jane", "Bob", "Alice", "Charlie"]
+LAST_NAMES = ["Doe", "Smith", "Johnson", "Brown", "Davis"]
+
+# Pre-serialized JSON bodies; each row only substitutes its random values instead
+# of building and encoding the same dict structure. The substituted strings come
+# from the lists above and never need escaping.
+PET_JSON_TEMPLATE = (
+    '{"id":%d,"name":"%s","status":"%s","category":{"id":%d,"name":"%s"},'
+    '%s"tags":[{"id":%d,"name":"tag%d"}]}'
+)
+PET_PHOTO_URLS_JSON_TEMPLATE = '"photoUrls":["https://example.com/photo%d.jpg"],'
+USER_JSON_TEMPLATE = (
+    '{"id":%d,"username":"user%d","firstName":"%s","lastName":"%s",'
+    '"email":"user%d@example.com","phone":"+1-555-%d-%d","userStatus":%d}'
+)
+INVENTORY_JSON_TEMPLATE = '{"available":%d,"pending":%d,"sold":%d}'
+SUCCESS_JSON_TEMPLATE = '{"message":"success","data":{"id":%d}}'
+
+
+def _dumps(obj):
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        # Decoded so the columns keep TEXT affinity rather than becoming BLOBs
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def generate_sample_headers(user_agent, client_ip, rng=random, content_type=None):
     """Generate realistic HTTP headers."""
+    if content_type is None:
+        content_type = rng.choice(CONTENT_TYPES)
     return {
         "host": "localhost:8000",
         "user-agent": user_agent,
@@ -95,268 +194,253 @@ def generate_sample_headers(user_agent, client_ip):
         "accept-encoding": "gzip, deflate",
         "connection": "keep-alive",
         "x-forwarded-for": client_ip,
-        "content-type": "application/json"
-        if random.choice([True, False])
-        else "text/plain",
+        "content-type": content_type,
     }
 
 
-def generate_sample_response_body(path, method):
+# Every possible header set serialized once, keyed by (user agent, client IP);
+# there are only a few hundred, so rows pick a string instead of encoding one
+HEADER_JSON_CACHE = {
+    (user_agent, client_ip): [
+        _dumps(
+            generate_sample_headers(user_agent, client_ip, content_type=content_type)
+        )
+        for content_type in CONTENT_TYPES
+    ]
+    for user_agent in USER_AGENTS
+    for client_ip in CLIENT_IPS
+}
+
+
+def _pet_json(rng, with_photos=True):
+    """Fill the pet body template with random values."""
+    return PET_JSON_TEMPLATE % (
+        rng.randint(1, 1000),
+        rng.choice(PET_NAMES),
+        rng.choice(PET_STATUSES),
+        rng.randint(1, 10),
+        rng.choice(PET_CATEGORIES),
+        PET_PHOTO_URLS_JSON_TEMPLATE % rng.randint(1, 10) if with_photos else "",
+        rng.randint(1, 20),
+        rng.randint(1, 5),
+    )
+
+
+def _user_json(rng):
+    """Fill the user body template with random values."""
+    return USER_JSON_TEMPLATE % (
+        rng.randint(1, 1000),
+        rng.randint(1, 100),
+        rng.choice(FIRST_NAMES),
+        rng.choice(LAST_NAMES),
+        rng.randint(1, 100),
+        rng.randint(100, 999),
+        rng.randint(1000, 9999),
+        rng.randint(0, 2),
+    )
+
+
+def _inventory_json(rng):
+    """Fill the inventory body template with random values."""
+    return INVENTORY_JSON_TEMPLATE % (
+        rng.randint(10, 100),
+        rng.randint(5, 50),
+        rng.randint(20, 200),
+    )
+
+
+def generate_sample_response_body(path, method, rng=random):
     """Generate realistic response body based on endpoint."""
     if "/pet" in path and method == "GET":
         if "findByStatus" in path:
-            return json.dumps(
-                [
-                    {
-                        "id": random.randint(1, 1000),
-                        "name": random.choice(
-                            ["Fluffy", "Buddy", "Max", "Bella", "Charlie", "Luna"]
-                        ),
-                        "status": random.choice(["available", "pending", "sold"]),
-                        "category": {
-                            "id": random.randint(1, 10),
-                            "name": random.choice(["Dogs", "Cats", "Birds"]),
-                        },
-                        "tags": [
-                            {
-                                "id": random.randint(1, 20),
-                                "name": f"tag{random.randint(1, 5)}",
-                            }
-                        ],
-                    }
-                ]
-            )
-        elif "/user" in path:
-            return json.dumps(
-                {
-                    "id": random.randint(1, 1000),
-                    "username": f"user{random.randint(1, 100)}",
-                    "firstName": random.choice(
-                        ["John", "Jane", "Bob", "Alice", "Charlie"]
-                    ),
-                    "lastName": random.choice(
-                        ["Doe", "Smith", "Johnson", "Brown", "Davis"]
-                    ),
-                    "email": f"user{random.randint(1, 100)}@example.com",
-                    "phone": f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-                    "userStatus": random.randint(0, 2),
-                }
-            )
+            return f"[{_pet_json(rng, with_photos=False)}]"
         else:
-            return json.dumps(
-                {
-                    "id": random.randint(1, 1000),
-                    "name": random.choice(
-                        ["Fluffy", "Buddy", "Max", "Bella", "Charlie", "Luna"]
-                    ),
-                    "status": random.choice(["available", "pending", "sold"]),
-                    "category": {
-                        "id": random.randint(1, 10),
-                        "name": random.choice(["Dogs", "Cats", "Birds"]),
-                    },
-                    "photoUrls": [
-                        f"https://example.com/photo{random.randint(1, 10)}.jpg"
-                    ],
-                    "tags": [
-                        {
-                            "id": random.randint(1, 20),
-                            "name": f"tag{random.randint(1, 5)}",
-                        }
-                    ],
-                }
-            )
+            return _pet_json(rng)
     elif "/store/inventory" in path:
-        return json.dumps(
-            {
-                "available": random.randint(10, 100),
-                "pending": random.randint(5, 50),
-                "sold": random.randint(20, 200),
-            }
-        )
+        return _inventory_json(rng)
     elif "/user" in path and method == "GET":
-        return json.dumps(
-            {
-                "id": random.randint(1, 1000),
-                "username": f"user{random.randint(1, 100)}",
-                "firstName": random.choice(["John", "Jane", "Bob", "Alice", "Charlie"]),
-                "lastName": random.choice(
-                    ["Doe", "Smith", "Johnson", "Brown", "Davis"]
-                ),
-                "email": f"user{random.randint(1, 100)}@example.com",
-                "phone": f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-                "userStatus": random.randint(0, 2),
-            }
-        )
+        return _user_json(rng)
     else:
-        return json.dumps(
-            {"message": "success", "data": {"id": random.randint(1, 1000)}}
-        )
+        return SUCCESS_JSON_TEMPLATE % rng.randint(1, 1000)
 
 
-def generate_sample_request_body(path, method):
+def generate_sample_request_body(path, method, rng=random):
     """Generate realistic request body for POST/PUT requests."""
     if method in ["POST", "PUT"]:
         if "/pet" in path:
-            return json.dumps(
-                {
-                    "id": random.randint(1, 1000),
-                    "name": random.choice(
-                        ["Fluffy", "Buddy", "Max", "Bella", "Charlie", "Luna"]
-                    ),
-                    "status": random.choice(["available", "pending", "sold"]),
-                    "category": {
-                        "id": random.randint(1, 10),
-                        "name": random.choice(["Dogs", "Cats", "Birds"]),
-                    },
-                    "photoUrls": [
-                        f"https://example.com/photo{random.randint(1, 10)}.jpg"
-                    ],
-                    "tags": [
-                        {
-                            "id": random.randint(1, 20),
-                            "name": f"tag{random.randint(1, 5)}",
-                        }
-                    ],
-                }
-            )
+            return _pet_json(rng)
         elif "/store/inventory" in path:
-            return json.dumps(
-                {
-                    "available": random.randint(10, 100),
-                    "pending": random.randint(5, 50),
-                    "sold": random.randint(20, 200),
-                }
-            )
-        elif "/user" in path and method == "GET":
-            return json.dumps(
-                {
-                    "id": random.randint(1, 1000),
-                    "username": f"user{random.randint(1, 100)}",
-                    "firstName": random.choice(
-                        ["John", "Jane", "Bob", "Alice", "Charlie"]
-                    ),
-                    "lastName": random.choice(
-                        ["Doe", "Smith", "Johnson", "Brown", "Davis"]
-                    ),
-                    "email": f"user{random.randint(1, 100)}@example.com",
-                    "phone": f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-                    "userStatus": random.randint(0, 2),
-                }
-            )
+            return _inventory_json(rng)
     return None
 
 
-def generate_test_logs(conn, num_logs=500):
-    """Generate realistic test logs with performance metrics."""
-    cursor = conn.cursor()
+def _generate_log_batch(first_index, num_logs, start_time, end_time, id_prefix):
+    """
+    Generate one batch of (request log, performance metric) row pairs.
 
-    print(f"Generating {num_logs} test logs...")
+    May run in a worker process, so it keeps its own random generator.
+    """
+    rng = random.Random()
 
-    # Time range: past week
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=7)
+    # Bound methods skip the attribute lookups in the per-row loop
+    rnd = rng.random
+    randint = rng.randint
+    choice = rng.choice
+    choices = rng.choices
 
-    for i in range(num_logs):
-        # Random timestamp within the past week
-        random_time = start_time + timedelta(
-            seconds=random.randint(0, int((end_time - start_time).total_seconds()))
-        )
+    span_seconds = int((end_time - start_time).total_seconds())
+    batch_size = min(LOG_INSERT_BATCH_SIZE, num_logs - first_index)
+    rows = []
 
-        # Random endpoint
-        path, method = random.choice(ENDPOINTS)
+    # The independent numeric columns are drawn a column at a time;
+    # choices() over a range is much cheaper per value than randint()
+    time_offsets = choices(range(span_seconds + 1), k=batch_size)
+    status_codes = choices(
+        STATUS_CODES, cum_weights=STATUS_CODE_CUM_WEIGHTS, k=batch_size
+    )
+    process_times = choices(range(1, 501), k=batch_size)  # 1-500ms
+    client_ports = choices(range(40000, 65001), k=batch_size)
+    memory_usage = [45.0 + 10.0 * rnd() for _ in range(batch_size)]  # 45-55MB
+    cpu_usage = [0.5 + 4.5 * rnd() for _ in range(batch_size)]  # 0.5-5%
+    db_queries = choices(range(4), k=batch_size)
+    cache_hits = choices(range(6), k=batch_size)
+    cache_misses = choices(range(3), k=batch_size)
 
-        # Replace path parameters with actual values
-        if "{petId}" in path:
-            path = path.replace("{petId}", str(random.randint(1, 100)))
-        if "{orderId}" in path:
-            path = path.replace("{orderId}", str(random.randint(1, 1000)))
-        if "{username}" in path:
-            path = path.replace("{username}", f"user{random.randint(1, 50)}")
+    for j in range(batch_size):
+        i = first_index + j
 
-        # Random response characteristics
-        status_code = random.choices(
-            [200, 201, 400, 404, 500],
-            weights=[70, 15, 8, 5, 2],  # Mostly successful responses
-        )[0]
+        # Random timestamp within the past week
+        random_time = start_time + timedelta(seconds=time_offsets[j])
+        # Same text as strftime("%Y-%m-%dT%H:%M:%S"), formatted once per row
+        timestamp = random_time.isoformat(timespec="seconds")
 
-        process_time_ms = random.randint(1, 500)  # 1-500ms response time
+        # Random endpoint
+        paths, method = choice(ENDPOINT_PATH_POOLS)
+        path = choice(paths)
+
+        status_code = status_codes[j]
+        process_time_ms = process_times[j]
 
         # Random client info
-        client_ip = random.choice(CLIENT_IPS)
-        user_agent = random.choice(USER_AGENTS)
+        client_ip = choice(CLIENT_IPS)
+        user_agent = choice(USER_AGENTS)
 
         # Generate request/response data
-        headers = generate_sample_headers(user_agent, client_ip)
-        request_body = generate_sample_request_body(path, method)
-        response_body = generate_sample_response_body(path, method)
+        headers_json = choice(HEADER_JSON_CACHE[user_agent, client_ip])
+        request_body = generate_sample_request_body(path, method, rng)
+        response_body = generate_sample_response_body(path, method, rng)
 
         # Random session info (some requests have sessions)
-        session_id = (
-            f"session_{random.randint(1, 20)}" if random.random() < 0.3 else None
-        )
-        test_scenario = random.choice(
+        session_id = f"session_{randint(1, 20)}" if rnd() < 0.3 else None
+        test_scenario = choice(
             ["load_test", "stress_test", None, None, None]
         )  # 40% have scenarios
-        correlation_id = (
-            f"corr_{random.randint(1000, 9999)}" if random.random() < 0.2 else None
-        )
+        correlation_id = f"corr_{randint(1000, 9999)}" if rnd() < 0.2 else None
 
-        # Insert request log
-        request_id = f"req_{int(time.time() * 1000)}_{i}"
-        cursor.execute(
-            """
-            INSERT INTO request_logs (
-                id, timestamp, method, path, status_code, process_time_ms,
-                client_ip, client_port, headers, query_params, request_body,
-                response_body, session_id, correlation_id, test_scenario
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+        request_id = f"{id_prefix}{i}"
+        rows.append(
             (
-                request_id,
-                random_time.strftime("%Y-%m-%dT%H:%M:%S"),
-                method,
-                path,
-                status_code,
-                process_time_ms,
-                client_ip,
-                str(random.randint(40000, 65000)),  # Random client port
-                json.dumps(headers),
-                "status=available" if "findByStatus" in path else "",
-                request_body,
-                response_body,
-                session_id,
-                correlation_id,
-                test_scenario,
-            ),
+                (
+                    request_id,
+                    timestamp,
+                    method,
+                    path,
+                    status_code,
+                    process_time_ms,
+                    client_ip,
+                    # Stored as text by the column's TEXT affinity, as the servers do
+                    client_ports[j],
+                    headers_json,
+                    "status=available" if "findByStatus" in path else "",
+                    request_body,
+                    response_body,
+                    session_id,
+                    correlation_id,
+                    test_scenario,
+                ),
+                (
+                    request_id,
+                    process_time_ms,
+                    memory_usage[j],
+                    cpu_usage[j],
+                    db_queries[j],
+                    cache_hits[j],
+                    cache_misses[j],
+                    len(request_body) if request_body else 0,
+                    len(response_body) if response_body else 0,
+                    timestamp,
+                ),
+            )
         )
 
-        # Insert performance metrics
-        cursor.execute(
-            """
-            INSERT INTO performance_metrics (
-                request_id, response_time_ms, memory_usage_mb, cpu_usage_percent,
-                db_queries, cache_hits, cache_misses, request_size_bytes,
-                response_size_bytes, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                request_id,
-                process_time_ms,
-                random.uniform(45.0, 55.0),  # Memory usage 45-55MB
-                random.uniform(0.5, 5.0),  # CPU usage 0.5-5%
-                random.randint(0, 3),  # DB queries
-                random.randint(0, 5),  # Cache hits
-                random.randint(0, 2),  # Cache misses
-                len(request_body) if request_body else 0,
-                len(response_body) if response_body else 0,
-                random_time.strftime("%Y-%m-%dT%H:%M:%S"),
-            ),
+    return rows
+
+
+def _insert_log_batches(cursor, batches):
+    """Insert generated log batches as they arrive."""
+    inserted = 0
+    for batch in batches:
+        cursor.executemany(
+            REQUEST_LOG_INSERT_SQL, [request_row for request_row, _ in batch]
         )
+        cursor.executemany(
+            PERFORMANCE_METRIC_INSERT_SQL, [metric_row for _, metric_row in batch]
+        )
+        inserted += len(batch)
+        print(f"Generated {inserted} logs...")
+
+
+def _pooled_log_batches(generate_batch, batch_starts, workers):
+    """Yield log batches in order from worker processes, a few at a time."""
+    starts = iter(batch_starts)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Executor.map would submit every batch up front and let finished ones
+        # pile up here, so keep at most two per worker outstanding
+        pending = deque(
+            executor.submit(generate_batch, first_index)
+            for first_index in islice(starts, 2 * workers)
+        )
+        while pending:
+            batch = pending.popleft().result()
+            next_start = next(starts, None)
+            if next_start is not None:
+                pending.append(executor.submit(generate_batch, next_start))
+            yield batch
 
-        if (i + 1) % 100 == 0:
-            print(f"Generated {i + 1} logs...")
 
-    conn.commit()
+def generate_test_logs(conn, num_logs=500, workers=None):
+    """Generate realistic test logs with performance metrics."""
+    cursor = conn.cursor()
+
+    print(f"Generating {num_logs} test logs...")
+
+    # Time range: past week
+    end_time = datetime.now()
+    start_time = end_time - timedelta(days=7)
+
+    # The row index already makes ids unique, so read the clock only once
+    id_prefix = f"req_{int(time.time() * 1000)}_"
+
+    generate_batch = partial(
+        _generate_log_batch,
+        num_logs=num_logs,
+        start_time=start_time,
+        end_time=end_time,
+        id_prefix=id_prefix,
+    )
+    batch_starts = range(0, num_logs, LOG_INSERT_BATCH_SIZE)
+
+    # Row generation is CPU-bound, so batches are built in worker processes
+    # while this process stays the only SQLite writer. Memory stays bounded by
+    # the batches in flight however many logs are requested.
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(batch_starts) < 2:
+        _insert_log_batches(cursor, map(generate_batch, batch_starts))
+    else:
+        _insert_log_batches(
+            cursor, _pooled_log_batches(generate_batch, batch_starts, workers)
+        )
+
     print(f"Successfully generated {num_logs} test logs!")
 
 
@@ -437,12 +521,11 @@ def create_demo_scenarios(conn, num_scenarios=2):
             (
                 scenario["name"],
                 scenario["description"],
-                json.dumps(scenario["config"]),
+                _dumps(scenario["config"]),
                 0,
             ),
         )
 
-    conn.commit()
     print(f"Successfully created {num_scenarios} demo scenarios!")
 
 
@@ -452,67 +535,61 @@ def update_test_sessions(conn):
 
     print("Creating test sessions...")
 
-    # Get unique session IDs from logs
+    # Each session's first scenario, in one pass; with MIN(rowid) SQLite takes
+    # the bare test_scenario column from that same first row
     cursor.execute(
-        "SELECT DISTINCT session_id FROM request_logs WHERE session_id IS NOT NULL"
+        """
+        SELECT session_id, test_scenario, MIN(rowid)
+        FROM request_logs
+        WHERE session_id IS NOT NULL AND test_scenario IS NOT NULL
+        GROUP BY session_id
+    """
     )
-    session_ids = [row[0] for row in cursor.fetchall()]
-
-    for session_id in session_ids:
-        # Get session stats
-        cursor.execute(
-            """
-            SELECT COUNT(*), AVG(process_time_ms), MIN(timestamp), MAX(timestamp)
-            FROM request_logs
-            WHERE session_id = ?
-        """,
-            (session_id,),
-        )
+    scenario_map = {session_id: scenario for session_id, scenario, _ in cursor}
 
-        stats = cursor.fetchone()
-        if stats:
-            total_requests, avg_response_time, start_time, end_time = stats
-
-            # Determine scenario name
-            cursor.execute(
-                """
-                SELECT test_scenario FROM request_logs
-                WHERE session_id = ? AND test_scenario IS NOT NULL
-                LIMIT 1
-            """,
-                (session_id,),
-            )
+    # One grouped pass over the logs gathers every session's stats at once
+    cursor.execute(
+        """
+        SELECT session_id, COUNT(*), AVG(process_time_ms), MIN(timestamp),
+               MAX(timestamp)
+        FROM request_logs
+        WHERE session_id IS NOT NULL
+        GROUP BY session_id
+    """
+    )
 
-            scenario_result = cursor.fetchone()
-            scenario_name = scenario_result[0] if scenario_result else "general_testing"
-
-            # Insert test session
-            cursor.execute(
-                """
-                INSERT INTO test_sessions (
-                    session_id, start_time, end_time, total_requests,
-                    avg_response_time_ms, scenario_name, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    session_id,
-                    start_time,
-                    end_time,
-                    total_requests,
-                    avg_response_time,
-                    scenario_name,
-                    json.dumps(
-                        {
-                            "client_info": "Generated test session",
-                            "test_type": scenario_name,
-                            "duration_minutes": random.randint(5, 60),
-                        }
-                    ),
+    session_rows = []
+    for session_id, total_requests, avg_response_time, start_time, end_time in cursor:
+        scenario_name = scenario_map.get(session_id, "general_testing")
+        session_rows.append(
+            (
+                session_id,
+                start_time,
+                end_time,
+                total_requests,
+                avg_response_time,
+                scenario_name,
+                _dumps(
+                    {
+                        "client_info": "Generated test session",
+                        "test_type": scenario_name,
+                        "duration_minutes": random.randint(5, 60),
+                    }
                 ),
             )
+        )
 
-    conn.commit()
-    print(f"Successfully created {len(session_ids)} test sessions!")
+    cursor.executemany(
+        """
+        INSERT INTO test_sessions (
+            session_id, start_time, end_time, total_requests,
+            avg_response_time_ms, scenario_name, metadata
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    """,
+        session_rows,
+    )
+
+    print(f"Successfully created {len(session_rows)} test sessions!")
 
 
 def init_database(conn):
@@ -593,6 +670,26 @@ def init_database(conn):
     print("Database tables initialized successfully!")
 
 
+def drop_indexes(conn):
+    """Drop the analytics indexes so the bulk load does not maintain them."""
+    cursor = conn.cursor()
+    for name, _table, _column in LOG_INDEXES:
+        cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def create_indexes(conn):
+    """Create the analytics indexes once the logs are loaded."""
+    cursor = conn.cursor()
+
+    print("Creating indexes...")
+
+    # Built in one pass after the bulk load rather than maintained per insert
+    for name, table, column in LOG_INDEXES:
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({column})")
+
+    print("Indexes created successfully!")
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -621,6 +718,13 @@ Examples:
         help="Number of test logs to generate (default: 500)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for log generation (default: one per CPU)",
+    )
+
     parser.add_argument(
         "--scenarios",
         type=int,
@@ -646,14 +750,36 @@ def main():
     args.db_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Connect to database
-    conn = sqlite3.connect(str(args.db_path))
+    # Autocommit mode, so main() controls the transaction explicitly; the larger
+    # statement cache keeps every prepared statement of the run cached
+    conn = sqlite3.connect(
+        str(args.db_path), isolation_level=None, cached_statements=256
+    )
+
+    # Tune for bulk loading: WAL avoids rollback-journal syncs and NORMAL skips
+    # the fsync on every commit; this is generated data, so durability can give
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
 
     try:
         # Initialize database tables
         init_database(conn)
 
+        # Generate everything in one transaction so there is a single commit
+        conn.execute("BEGIN IMMEDIATE")
+
+        # Existing indexes would be updated row by row during the load, so
+        # drop them here and rebuild them in bulk afterwards
+        drop_indexes(conn)
+
         # Generate test logs and performance metrics
-        generate_test_logs(conn, args.num_logs)
+        generate_test_logs(conn, args.num_logs, args.workers)
+
+        # Index the loaded logs before the session queries use them
+        create_indexes(conn)
 
         # Create demo scenarios
         create_demo_scenarios(conn, min(args.scenarios, 3))
@@ -661,6 +787,8 @@ def main():
         # Create test sessions
         update_test_sessions(conn)
 
+        conn.execute("COMMIT")
+
         print("\n" + "=" * 40)
         print("✅ Test data generation completed successfully!")
         print(f"📊 Generated {args.num_logs} request logs")
@@ -5,6 +5,7 @@ Tests core functionality without MCP server dependencies.
 """
 
 import asyncio
+import copy
 from datetime import datetime
 import json
 from pathlib import Path
@@ -22,333 +23,336 @@ from mockloop_mcp.database_migration import DatabaseMigrator
 from mockloop_mcp.generator import generate_mock_api
 from mockloop_mcp.log_analyzer import LogAnalyzer
 from mockloop_mcp.mock_server_manager import MockServerManager
+from mockloop_mcp.utils.event_loop import ensure_uvloop
 from mockloop_mcp.utils.http_client import MockServerClient, check_server_connectivity
 
-
-class FinalIntegrationTester:
-    """Final integration test suite for MockLoop MCP enhancement plan."""
-
-    def __init__(self):
-        self.test_results = {}
-        self.temp_dir = None
-        self.mock_server_dir = None
-
-    def setup_test_environment(self):
-        """Set up temporary test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="mockloop_final_test_"))
-
-    def cleanup_test_environment(self):
-        """Clean up test environment."""
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-
-    def create_comprehensive_test_spec(self) -> dict[str, Any]:
-        """Create a comprehensive test API specification."""
-        return {
-            "openapi": "3.0.0",
-            "info": {
-                "title": "Final Integration Test API",
-                "version": "2.0.0",
-                "description": "Comprehensive API for testing all MockLoop MCP enhancement features",
-            },
-            "servers": [
-                {"url": "http://localhost:8000", "description": "Development server"}
-            ],
-            "paths": {
-                "/users": {
-                    "get": {
-                        "summary": "Get all users",
-                        "tags": ["Users"],
-                        "responses": {
-                            "200": {
-                                "description": "List of users",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "array",
-                                            "items": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "id": {"type": "integer"},
-                                                    "name": {"type": "string"},
-                                                    "email": {"type": "string"},
-                                                    "created_at": {
-                                                        "type": "string",
-                                                        "format": "date-time",
-                                                    },
-                                                },
-                                            },
-                                        }
-                                    }
-                                },
-                            }
-                        },
-                    },
-                    "post": {
-                        "summary": "Create a user",
-                        "tags": ["Users"],
-                        "requestBody": {
-                            "required": True,
-                            "content": {
-                                "application/json": {
-                                    "schema": {
+# Built once at import; treat as read-only and use
+# create_comprehensive_test_spec() for a copy that can be modified
+COMPREHENSIVE_TEST_SPEC: dict[str, Any] = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "Final Integration Test API",
+        "version": "2.0.0",
+        "description": "Comprehensive API for testing all MockLoop MCP enhancement features",
+    },
+    "servers": [{"url": "http://localhost:8000", "description": "Development server"}],
+    "paths": {
+        "/users": {
+            "get": {
+                "summary": "Get all users",
+                "tags": ["Users"],
+                "responses": {
+                    "200": {
+                        "description": "List of users",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "items": {
                                         "type": "object",
-                                        "required": ["name", "email"],
                                         "properties": {
+                                            "id": {"type": "integer"},
                                             "name": {"type": "string"},
-                                            "email": {
+                                            "email": {"type": "string"},
+                                            "created_at": {
                                                 "type": "string",
-                                                "format": "email",
+                                                "format": "date-time",
                                             },
                                         },
-                                    }
+                                    },
                                 }
-                            },
+                            }
                         },
-                        "responses": {
-                            "201": {
-                                "description": "User created",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "object",
-                                            "properties": {
-                                                "id": {"type": "integer"},
-                                                "name": {"type": "string"},
-                                                "email": {"type": "string"},
-                                                "created_at": {
-                                                    "type": "string",
-                                                    "format": "date-time",
-                                                },
-                                            },
-                                        }
-                                    }
+                    }
+                },
+            },
+            "post": {
+                "summary": "Create a user",
+                "tags": ["Users"],
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "required": ["name", "email"],
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "email": {
+                                        "type": "string",
+                                        "format": "email",
+                                    },
                                 },
                             }
-                        },
+                        }
                     },
                 },
-                "/users/{user_id}": {
-                    "get": {
-                        "summary": "Get user by ID",
-                        "tags": ["Users"],
-                        "parameters": [
-                            {
-                                "name": "user_id",
-                                "in": "path",
-                                "required": True,
-                                "schema": {"type": "integer"},
+                "responses": {
+                    "201": {
+                        "description": "User created",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "id": {"type": "integer"},
+                                        "name": {"type": "string"},
+                                        "email": {"type": "string"},
+                                        "created_at": {
+                                            "type": "string",
+                                            "format": "date-time",
+                                        },
+                                    },
+                                }
                             }
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "User details",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "object",
-                                            "properties": {
-                                                "id": {"type": "integer"},
-                                                "name": {"type": "string"},
-                                                "email": {"type": "string"},
-                                                "created_at": {
-                                                    "type": "string",
-                                                    "format": "date-time",
-                                                },
-                                            },
-                                        }
-                                    }
-                                },
-                            },
-                            "404": {"description": "User not found"},
                         },
-                    },
-                    "put": {
-                        "summary": "Update user",
-                        "tags": ["Users"],
-                        "parameters": [
-                            {
-                                "name": "user_id",
-                                "in": "path",
-                                "required": True,
-                                "schema": {"type": "integer"},
-                            }
-                        ],
-                        "requestBody": {
-                            "required": True,
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "name": {"type": "string"},
-                                            "email": {
-                                                "type": "string",
-                                                "format": "email",
-                                            },
+                    }
+                },
+            },
+        },
+        "/users/{user_id}": {
+            "get": {
+                "summary": "Get user by ID",
+                "tags": ["Users"],
+                "parameters": [
+                    {
+                        "name": "user_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "integer"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "User details",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "id": {"type": "integer"},
+                                        "name": {"type": "string"},
+                                        "email": {"type": "string"},
+                                        "created_at": {
+                                            "type": "string",
+                                            "format": "date-time",
                                         },
-                                    }
+                                    },
                                 }
-                            },
-                        },
-                        "responses": {
-                            "200": {"description": "User updated"},
-                            "404": {"description": "User not found"},
-                        },
-                    },
-                    "delete": {
-                        "summary": "Delete user",
-                        "tags": ["Users"],
-                        "parameters": [
-                            {
-                                "name": "user_id",
-                                "in": "path",
-                                "required": True,
-                                "schema": {"type": "integer"},
                             }
-                        ],
-                        "responses": {
-                            "204": {"description": "User deleted"},
-                            "404": {"description": "User not found"},
                         },
                     },
+                    "404": {"description": "User not found"},
                 },
-                "/products": {
-                    "get": {
-                        "summary": "Get all products",
-                        "tags": ["Products"],
-                        "parameters": [
-                            {
-                                "name": "category",
-                                "in": "query",
-                                "schema": {"type": "string"},
-                            },
-                            {
-                                "name": "limit",
-                                "in": "query",
-                                "schema": {"type": "integer", "default": 10},
-                            },
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "List of products",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "object",
-                                            "properties": {
-                                                "products": {
-                                                    "type": "array",
-                                                    "items": {
-                                                        "type": "object",
-                                                        "properties": {
-                                                            "id": {"type": "integer"},
-                                                            "name": {"type": "string"},
-                                                            "price": {"type": "number"},
-                                                            "category": {
-                                                                "type": "string"
-                                                            },
-                                                        },
-                                                    },
-                                                },
-                                                "total": {"type": "integer"},
-                                                "page": {"type": "integer"},
-                                            },
-                                        }
-                                    }
+            },
+            "put": {
+                "summary": "Update user",
+                "tags": ["Users"],
+                "parameters": [
+                    {
+                        "name": "user_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "integer"},
+                    }
+                ],
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "email": {
+                                        "type": "string",
+                                        "format": "email",
+                                    },
                                 },
                             }
-                        },
+                        }
+                    },
+                },
+                "responses": {
+                    "200": {"description": "User updated"},
+                    "404": {"description": "User not found"},
+                },
+            },
+            "delete": {
+                "summary": "Delete user",
+                "tags": ["Users"],
+                "parameters": [
+                    {
+                        "name": "user_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "integer"},
                     }
+                ],
+                "responses": {
+                    "204": {"description": "User deleted"},
+                    "404": {"description": "User not found"},
                 },
-                "/orders": {
-                    "post": {
-                        "summary": "Create an order",
-                        "tags": ["Orders"],
-                        "requestBody": {
-                            "required": True,
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "required": ["user_id", "items"],
-                                        "properties": {
-                                            "user_id": {"type": "integer"},
+            },
+        },
+        "/products": {
+            "get": {
+                "summary": "Get all products",
+                "tags": ["Products"],
+                "parameters": [
+                    {
+                        "name": "category",
+                        "in": "query",
+                        "schema": {"type": "string"},
+                    },
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "schema": {"type": "integer", "default": 10},
+                    },
+                ],
+                "responses": {
+                    "200": {
+                        "description": "List of products",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "products": {
+                                            "type": "array",
                                             "items": {
-                                                "type": "array",
-                                                "items": {
-                                                    "type": "object",
-                                                    "properties": {
-                                                        "product_id": {
-                                                            "type": "integer"
-                                                        },
-                                                        "quantity": {"type": "integer"},
-                                                    },
+                                                "type": "object",
+                                                "properties": {
+                                                    "id": {"type": "integer"},
+                                                    "name": {"type": "string"},
+                                                    "price": {"type": "number"},
+                                                    "category": {"type": "string"},
                                                 },
                                             },
                                         },
-                                    }
+                                        "total": {"type": "integer"},
+                                        "page": {"type": "integer"},
+                                    },
                                 }
-                            },
+                            }
                         },
-                        "responses": {
-                            "201": {
-                                "description": "Order created",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
+                    }
+                },
+            }
+        },
+        "/orders": {
+            "post": {
+                "summary": "Create an order",
+                "tags": ["Orders"],
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "required": ["user_id", "items"],
+                                "properties": {
+                                    "user_id": {"type": "integer"},
+                                    "items": {
+                                        "type": "array",
+                                        "items": {
                                             "type": "object",
                                             "properties": {
-                                                "id": {"type": "integer"},
-                                                "user_id": {"type": "integer"},
-                                                "total": {"type": "number"},
-                                                "status": {"type": "string"},
-                                                "created_at": {
-                                                    "type": "string",
-                                                    "format": "date-time",
-                                                },
+                                                "product_id": {"type": "integer"},
+                                                "quantity": {"type": "integer"},
                                             },
-                                        }
-                                    }
+                                        },
+                                    },
                                 },
                             }
+                        }
+                    },
+                },
+                "responses": {
+                    "201": {
+                        "description": "Order created",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "id": {"type": "integer"},
+                                        "user_id": {"type": "integer"},
+                                        "total": {"type": "number"},
+                                        "status": {"type": "string"},
+                                        "created_at": {
+                                            "type": "string",
+                                            "format": "date-time",
+                                        },
+                                    },
+                                }
+                            }
                         },
                     }
                 },
+            }
+        },
+    },
+    "components": {
+        "schemas": {
+            "User": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                    "email": {"type": "string"},
+                    "created_at": {"type": "string", "format": "date-time"},
+                },
             },
-            "components": {
-                "schemas": {
-                    "User": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "integer"},
-                            "name": {"type": "string"},
-                            "email": {"type": "string"},
-                            "created_at": {"type": "string", "format": "date-time"},
-                        },
-                    },
-                    "Product": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "integer"},
-                            "name": {"type": "string"},
-                            "price": {"type": "number"},
-                            "category": {"type": "string"},
-                        },
-                    },
-                }
+            "Product": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                    "price": {"type": "number"},
+                    "category": {"type": "string"},
+                },
             },
         }
+    },
+}
+
+
+class FinalIntegrationTester:
+    """Final integration test suite for MockLoop MCP enhancement plan."""
+
+    def __init__(self):
+        self.test_results = {}
+        self.temp_dir = None
+        self.mock_server_dir = None
+
+    def setup_test_environment(self):
+        """Set up temporary test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="mockloop_final_test_"))
+
+    def cleanup_test_environment(self):
+        """
+        Clean up test environment.
+
+        Removing the whole temp directory also takes the WAL and shared-memory
+        files that SQLite leaves next to the test database.
+        """
+        if self.temp_dir and self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def create_comprehensive_test_spec(self) -> dict[str, Any]:
+        """Create a comprehensive test API specification."""
+        # A copy, so callers are free to mutate it
+        return copy.deepcopy(COMPREHENSIVE_TEST_SPEC)
 
     def test_enhanced_mock_generation(self) -> bool:
         """Test enhanced mock server generation with all features."""
 
         try:
             # Test with comprehensive API spec
-            test_spec = self.create_comprehensive_test_spec()
-
             output_dir = generate_mock_api(
-                test_spec,
+                COMPREHENSIVE_TEST_SPEC,
                 mock_server_name="final_integration_test_server",
                 auth_enabled=True,
                 webhooks_enabled=True,
@@ -468,6 +472,13 @@ class FinalIntegrationTester:
 
             # Verify all tables exist
             conn = sqlite3.connect(str(db_path))
+            conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                """
+            )
             cursor = conn.cursor()
 
             expected_tables = [
@@ -478,18 +489,15 @@ class FinalIntegrationTester:
                 "schema_version",
             ]
 
-            missing_tables = []
-            for table in expected_tables:
-                cursor.execute(
-                    """
-                    SELECT name FROM sqlite_master
-                    WHERE type='table' AND name=?
-                """,
-                    (table,),
-                )
-
-                if not cursor.fetchone():
-                    missing_tables.append(table)
+            placeholders = ", ".join("?" * len(expected_tables))
+            cursor.execute(
+                f"""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name IN ({placeholders})
+            """,  # noqa: S608
+                expected_tables,
+            )
+            missing_tables = set(expected_tables) - {row[0] for row in cursor}
 
             if missing_tables:
                 conn.close()
@@ -592,29 +600,6 @@ class FinalIntegrationTester:
                 ),
             ]
 
-            for data in test_data:
-                cursor.execute(
-                    """
-                    INSERT INTO request_logs (
-                        timestamp, type, method, path, status_code, process_time_ms,
-                        client_host, client_port, headers, query_params, request_body,
-                        response_body, session_id, test_scenario, correlation_id,
-                        user_agent, response_size, is_admin
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    data,
-                )
-
-            conn.commit()
-
-            # Verify data insertion
-            cursor.execute("SELECT COUNT(*) FROM request_logs")
-            count = cursor.fetchone()[0]
-
-            if count != len(test_data):
-                conn.close()
-                return False
-
             # Test scenario management
 
             test_scenarios = [
@@ -638,16 +623,34 @@ class FinalIntegrationTester:
                 ),
             ]
 
-            for scenario in test_scenarios:
-                cursor.execute(
+            # Both batches go in one transaction, parsing each statement once
+            with conn:
+                cursor.executemany(
+                    """
+                    INSERT INTO request_logs (
+                        timestamp, type, method, path, status_code, process_time_ms,
+                        client_host, client_port, headers, query_params, request_body,
+                        response_body, session_id, test_scenario, correlation_id,
+                        user_agent, response_size, is_admin
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    test_data,
+                )
+                cursor.executemany(
                     """
                     INSERT INTO mock_scenarios (name, description, config, is_active)
                     VALUES (?, ?, ?, ?)
                 """,
-                    scenario,
+                    test_scenarios,
                 )
 
-            conn.commit()
+            # Verify data insertion
+            cursor.execute("SELECT COUNT(*) FROM request_logs")
+            count = cursor.fetchone()[0]
+
+            if count != len(test_data):
+                conn.close()
+                return False
 
             # Verify scenarios
             cursor.execute("SELECT COUNT(*) FROM mock_scenarios")
@@ -999,8 +1002,14 @@ class FinalIntegrationTester:
 
             # Generate multiple test servers
             for i in range(3):
-                test_spec = self.create_comprehensive_test_spec()
-                test_spec["info"]["title"] = f"Performance Test API {i}"
+                # Only the info block differs; the paths tree is shared
+                test_spec = {
+                    **COMPREHENSIVE_TEST_SPEC,
+                    "info": {
+                        **COMPREHENSIVE_TEST_SPEC["info"],
+                        "title": f"Performance Test API {i}",
+                    },
+                }
 
                 output_dir = generate_mock_api(
                     test_spec,
@@ -1221,5 +1230,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Only when run as a script: pytest imports this module and owns its own loop
+    ensure_uvloop()
     exit_code = main()
     sys.exit(exit_code)
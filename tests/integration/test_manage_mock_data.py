@@ -15,7 +15,8 @@ import contextlib
 
 from mockloop_mcp.main import manage_mock_data_tool
 from mockloop_mcp.mock_server_manager import MockServerManager
-from mockloop_mcp.utils.http_client import MockServerClient, check_server_connectivity
+from mockloop_mcp.utils.http_client import check_server_connectivity
+from tests._http_client_probes import probe_mock_data_methods
 
 
 async def test_manage_mock_data_tool():
@@ -24,6 +25,18 @@ async def test_manage_mock_data_tool():
     # Test server URL (assuming a mock server is running)
     test_server_url = "http://localhost:8000"
 
+    # A bare TCP probe fails in milliseconds when nothing is listening, so skip
+    # the HTTP round trips (and their timeouts) in the common no-server case
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection("localhost", 8000), timeout=0.2
+        )
+        writer.close()
+        await writer.wait_closed()
+    except (OSError, asyncio.TimeoutError):  # noqa: UP041
+        await test_tool_with_mock_server()
+        return
+
     try:
         connectivity_result = await check_server_connectivity(test_server_url)
 
@@ -145,37 +158,39 @@ async def test_tool_with_mock_server():
 async def test_http_client_extensions():
     """Test the new HTTP client methods."""
 
-    client = MockServerClient("http://localhost:8000")
+    results = await probe_mock_data_methods(
+        "http://localhost:8000",
+        update_kwargs={"endpoint_path": "/api/test", "response_data": {"test": "data"}},
+        scenario_name="test",
+        scenario_config={"test": "config"},
+        switch_to="test-scenario",
+    )
+    update_result = results["update"]
+    create_result = results["create"]
+    switch_result = results["switch"]
+    list_result = results["list"]
 
     try:
-        result = await client.update_response(
-            endpoint_path="/api/test", response_data={"test": "data"}
-        )
-        assert "status" in result
-        assert "endpoint_path" in result
+        assert "status" in update_result
+        assert "endpoint_path" in update_result
     except Exception:
         pass
 
     try:
-        result = await client.create_scenario(
-            scenario_name="test", scenario_config={"test": "config"}
-        )
-        assert "status" in result
-        assert "scenario_name" in result
+        assert "status" in create_result
+        assert "scenario_name" in create_result
     except Exception:
         pass
 
     try:
-        result = await client.switch_scenario("test-scenario")
-        assert "status" in result
-        assert "scenario_name" in result
+        assert "status" in switch_result
+        assert "scenario_name" in switch_result
     except Exception:
         pass
 
     try:
-        result = await client.list_scenarios()
-        assert "status" in result
-        assert "scenarios" in result
+        assert "status" in list_result
+        assert "scenarios" in list_result
     except Exception:
         pass
 
@@ -186,7 +201,10 @@ async def test_mock_server_manager_integration():
     manager = MockServerManager()
 
     with contextlib.suppress(Exception):
-        await manager.discover_running_servers(ports=[8000, 8001], check_health=False)
+        # Ports are probed concurrently; a short connect timeout bounds the scan
+        await manager.discover_running_servers(
+            ports=[8000, 8001], check_health=False, connect_timeout=0.2
+        )
 
     try:
         discovery = await manager.comprehensive_discovery()
@@ -0,0 +1,117 @@
+"""
+Unit tests for the database migration utilities.
+
+Tests migrating and backing up databases, including databases opened through
+an SQLite URI and databases with changes still in the write-ahead log.
+"""
+
+from pathlib import Path
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from src.mockloop_mcp.database_migration import DatabaseMigrator
+
+
+class TestURIDatabaseMigration(unittest.TestCase):
+    """Test cases for DatabaseMigrator with a shared in-memory URI database."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.uri = f"file:migration_uri_test_{id(self)}?mode=memory&cache=shared"
+        # A shared in-memory database lives only while a connection is open
+        self.keeper = sqlite3.connect(self.uri, uri=True)
+        self.migrator = DatabaseMigrator(self.uri, uri=True)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.keeper.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_migrations_apply_to_uri_database(self):
+        """Test that migrations run against the database the URI names."""
+        self.assertTrue(self.migrator.apply_migrations())
+        self.assertEqual(
+            self.migrator.get_current_version(), max(self.migrator.migrations)
+        )
+
+        # The tables are visible through an independent connection
+        cursor = self.keeper.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='request_logs'"
+        )
+        self.assertIsNotNone(cursor.fetchone())
+
+    def test_backup_requires_path_for_uri_database(self):
+        """Test that a URI database needs an explicit backup path."""
+        self.migrator.apply_migrations()
+
+        with self.assertRaises(ValueError):
+            self.migrator.backup_database()
+
+    def test_backup_uri_database_to_file(self):
+        """Test that a URI database is backed up to the given file."""
+        self.migrator.apply_migrations()
+        backup_path = Path(self.temp_dir) / "uri_backup.db"
+
+        result = self.migrator.backup_database(str(backup_path))
+
+        self.assertEqual(result, str(backup_path))
+        with sqlite3.connect(str(backup_path)) as conn:
+            version = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        self.assertEqual(version[0], max(self.migrator.migrations))
+
+
+class TestDatabaseBackup(unittest.TestCase):
+    """Test cases for DatabaseMigrator.backup_database on file databases."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = Path(self.temp_dir) / "test_backup.db"
+        self.backup_path = Path(self.temp_dir) / "test_backup_copy.db"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_backup_includes_pages_not_yet_checkpointed(self):
+        """Test that committed rows still in the WAL are part of the backup."""
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Keep every committed page in the WAL instead of the main file
+            conn.execute("PRAGMA wal_autocheckpoint=0")
+            with conn:
+                conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+                conn.executemany(
+                    "INSERT INTO items (name) VALUES (?)",
+                    [("first",), ("second",), ("third",)],
+                )
+            wal_path = self.db_path.with_name(f"{self.db_path.name}-wal")
+            self.assertGreater(wal_path.stat().st_size, 0)
+
+            # Back up while the writer is still open, so nothing is checkpointed
+            migrator = DatabaseMigrator(str(self.db_path))
+            migrator.backup_database(str(self.backup_path))
+        finally:
+            conn.close()
+
+        with sqlite3.connect(str(self.backup_path)) as backup:
+            names = [row[0] for row in backup.execute("SELECT name FROM items")]
+        self.assertEqual(names, ["first", "second", "third"])
+
+    def test_backup_missing_database_raises(self):
+        """Test that backing up a missing database fails without creating it."""
+        migrator = DatabaseMigrator(str(self.db_path))
+
+        with self.assertRaises(FileNotFoundError):
+            migrator.backup_database(str(self.backup_path))
+
+        self.assertFalse(self.db_path.exists())
+        self.assertFalse(self.backup_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
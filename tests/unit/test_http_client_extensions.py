@@ -7,12 +7,15 @@ Tests Phase 2 Part 1 HTTP client implementation without MCP dependencies.
 import asyncio
 from pathlib import Path
 import sys
+import time
+from unittest.mock import patch
 
 # Add the src directory to the path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from mockloop_mcp.mock_server_manager import MockServerManager
-from mockloop_mcp.utils.http_client import MockServerClient
+from mockloop_mcp.utils.http_client import MockServerClient, discover_running_servers
+from tests._http_client_probes import probe_mock_data_methods
 
 
 async def test_http_client_extensions():
@@ -20,72 +23,75 @@ async def test_http_client_extensions():
 
     # Test with a mock server URL (will fail gracefully if server not running)
     test_server_url = "http://localhost:8000"
-    client = MockServerClient(test_server_url)
 
-    try:
-        result = await client.update_response(
-            endpoint_path="/api/test",
-            response_data={"message": "Updated response", "test": True},
-            method="GET",
-        )
+    test_scenario_config = {
+        "name": "test-scenario",
+        "description": "Test scenario for validation",
+        "endpoints": {
+            "/api/users": {
+                "GET": {"status": 200, "data": [{"id": 1, "name": "Test User"}]}
+            }
+        },
+    }
+
+    results = await probe_mock_data_methods(
+        test_server_url,
+        update_kwargs={
+            "endpoint_path": "/api/test",
+            "response_data": {"message": "Updated response", "test": True},
+            "method": "GET",
+        },
+        scenario_name="test-scenario",
+        scenario_config=test_scenario_config,
+        switch_to="test-scenario",
+    )
+    update_result = results["update"]
+    create_result = results["create"]
+    switch_result = results["switch"]
+    list_result = results["list"]
+    current_result = results["current"]
 
+    try:
         # Verify expected structure
-        assert "status" in result
-        assert "endpoint_path" in result
-        assert "method" in result
-        assert result["endpoint_path"] == "/api/test"
-        assert result["method"] == "GET"
+        assert "status" in update_result
+        assert "endpoint_path" in update_result
+        assert "method" in update_result
+        assert update_result["endpoint_path"] == "/api/test"
+        assert update_result["method"] == "GET"
     except Exception:
         pass
 
     try:
-        test_scenario_config = {
-            "name": "test-scenario",
-            "description": "Test scenario for validation",
-            "endpoints": {
-                "/api/users": {
-                    "GET": {"status": 200, "data": [{"id": 1, "name": "Test User"}]}
-                }
-            },
-        }
-
-        result = await client.create_scenario(
-            scenario_name="test-scenario", scenario_config=test_scenario_config
-        )
-
         # Verify expected structure
-        assert "status" in result
-        assert "scenario_name" in result
-        assert result["scenario_name"] == "test-scenario"
+        assert "status" in create_result
+        assert "scenario_name" in create_result
+        assert create_result["scenario_name"] == "test-scenario"
     except Exception:
         pass
 
     try:
-        result = await client.switch_scenario("test-scenario")
-
         # Verify expected structure
-        assert "status" in result
-        assert "scenario_name" in result
-        assert result["scenario_name"] == "test-scenario"
+        assert "status" in switch_result
+        assert "scenario_name" in switch_result
+        assert switch_result["scenario_name"] == "test-scenario"
     except Exception:
         pass
 
     try:
-        result = await client.list_scenarios()
-
         # Verify expected structure
-        assert "status" in result
-        assert "scenarios" in result
-        assert "total_count" in result
+        assert "status" in list_result
+        assert "scenarios" in list_result
+        assert "total_count" in list_result
     except Exception:
         pass
 
     try:
-        result = await client.get_current_scenario()
-
         # Verify expected structure
-        assert "status" in result
-        assert "current_scenario" in result or result.get("status") == "error"
+        assert "status" in current_result
+        assert (
+            "current_scenario" in current_result
+            or current_result.get("status") == "error"
+        )
     except Exception:
         pass
 
@@ -96,8 +102,9 @@ async def test_mock_server_manager_integration():
     manager = MockServerManager()
 
     try:
+        # Ports are probed concurrently; a short connect timeout bounds the scan
         servers = await manager.discover_running_servers(
-            ports=[8000, 8001, 8002], check_health=False
+            ports=[8000, 8001, 8002], check_health=False, connect_timeout=0.2
         )
         for _server in servers:
             pass
@@ -134,6 +141,50 @@ async def test_error_handling():
         pass
 
 
+async def test_discovery_respects_max_concurrency():
+    """Test that discovery never probes more ports at once than allowed."""
+
+    in_flight = 0
+    peak = 0
+
+    async def refuse_connection(host, port):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        raise ConnectionRefusedError(port)
+
+    with patch("asyncio.open_connection", side_effect=refuse_connection):
+        servers = await discover_running_servers(
+            ports=range(9000, 9012), check_health=False, max_concurrency=3
+        )
+
+    assert servers == []
+    assert peak == 3
+
+
+async def test_discovery_connect_timeout_bounds_scan():
+    """Test that ports which never accept a connection are skipped quickly."""
+
+    async def hang(host, port):
+        await asyncio.sleep(10)
+
+    start = time.perf_counter()
+    with patch("asyncio.open_connection", side_effect=hang):
+        servers = await discover_running_servers(
+            ports=[9000, 9001, 9002, 9003],
+            check_health=False,
+            max_concurrency=2,
+            connect_timeout=0.05,
+        )
+    elapsed = time.perf_counter() - start
+
+    assert servers == []
+    # Two rounds of 0.05s timeouts, far below the 10s a connect would take
+    assert elapsed < 1.0
+
+
 def test_method_signatures():
     """Test that all new methods have correct signatures."""
 